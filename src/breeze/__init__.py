@@ -4,6 +4,10 @@ __version__ = "0.1.0"
 __author__ = "Breeze Development Team"
 __description__ = "Powerful CLI and Python tool for automating Python code understanding and transformation tasks"
 
-from .main import main
+def main():
+    """Entry point wrapper; imports the CLI stack only when actually run."""
+    from .main import main as _main
+    return _main()
+
 
 __all__ = ["main"]
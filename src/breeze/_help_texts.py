@@ -0,0 +1,260 @@
+"""Large help-text constants for the CLI, kept out of main's import path.
+
+These strings are only read when a user explicitly asks for help inside
+chat mode, so they live in their own module and are loaded on demand.
+"""
+
+EXAMPLES = """
+🌟 Breeze Usage Examples:
+
+📝 Documentation Generation:
+  breeze doc calculator.py                    # Python docstrings
+  breeze doc utils.js --output new-file       # JavaScript JSDoc
+  breeze doc MathUtils.java -v               # Java Javadoc with verbose output
+
+📊 Code Analysis:
+  breeze summarize large_project.py           # Get code overview
+  breeze inspect security_check.php           # Find security issues
+  breeze inspect memory_manager.cpp --verbose # C++ memory analysis
+
+🧪 Test Generation:
+  breeze test api_client.py --output new-file # Generate pytest tests
+  breeze test validator.js                    # Generate Jest tests
+  breeze test calculator.java                 # Generate JUnit tests
+
+⚡ Code Improvement:
+  breeze refactor legacy_code.py --secure     # Refactor with confirmation
+  breeze annotate api.ts --output in-place    # Add TypeScript types
+  breeze refactor old_script.js -v            # Modern JavaScript patterns
+
+🔄 Code Migration:
+  breeze migrate old_app.py --target "Python 3.12"
+  breeze migrate jquery_code.js --target "React"
+  breeze migrate legacy.java --target "Java 17"
+  breeze migrate script.py --target "TypeScript" --output new-file
+
+💬 Interactive Mode:
+  breeze chat                                 # Start interactive session
+  # In chat mode:
+  # > analyze my_project.py for performance issues
+  # > convert this Python code to JavaScript
+  # > help me refactor this function
+
+🎯 Output Modes:
+  --output console     # Display results (default)
+  --output in-place    # Modify original file  
+  --output new-file    # Create new file
+
+🛡️ Safety Options:
+  --secure            # Ask for confirmation before changes
+  --verbose           # Show detailed processing info
+
+📁 Supported File Types:
+  Programming: .py .js .ts .java .cpp .c .cs .php .rb .go .rs .swift .kt
+  Web:         .html .css .scss .sass .sql
+  Data:        .json .xml .yaml .yml
+  Config:      .sh .bat .ps1 .md .txt
+  And more!
+"""
+
+CHAT_HELP = """
+💬 Breeze Interactive Chat Mode Help:
+
+🎯 Direct Commands:
+  doc <file>                   - Generate documentation
+  summarize <file>             - Create code summary  
+  test <file>                  - Generate unit tests
+  inspect <file>               - Analyze for bugs and issues
+  refactor <file>              - Improve code structure
+  annotate <file>              - Add type annotations
+  migrate <file> --target X    - Migrate to target version/language
+
+🗣️ Natural Language Queries:
+  "Analyze security issues in auth.py"
+  "Generate tests for my calculator class"
+  "Convert this Python code to JavaScript"
+  "Refactor this function to be more readable"
+  "What are the potential bugs in this C++ code?"
+  "Add TypeScript types to my API client"
+  "Help me migrate from jQuery to React"
+
+🎛️ Chat Options:
+  help                         - Show this help message
+  examples                     - Show usage examples
+  supported                    - List supported file types
+  exit, quit, q               - Exit chat mode
+
+💡 Tips:
+  • You can reference files by path: "doc src/utils.py"  
+  • Ask questions about code: "What does this function do?"
+  • Request explanations: "Explain this algorithm"
+  • Get recommendations: "Best practices for this code?"
+  • Multiple files: "Compare these two implementations"
+
+🌟 Example Chat Session:
+  breeze> doc calculator.py
+  breeze> What security issues might this PHP code have?
+  breeze> Convert my Python script to TypeScript
+  breeze> help me optimize this SQL query
+  breeze> exit
+
+🔧 For non-interactive usage, use: breeze <command> <file> [options]
+"""
+
+SUPPORTED = """
+🌐 Breeze Supported Languages & File Types:
+
+💻 Programming Languages:
+  • Python         (.py)      - Docstrings, pytest, type hints
+  • JavaScript     (.js)      - JSDoc, Jest, modern ES features  
+  • TypeScript     (.ts)      - TSDoc, type annotations, interfaces
+  • Java           (.java)    - Javadoc, JUnit, generics
+  • C++            (.cpp/.cc) - Doxygen, Google Test, modern C++
+  • C              (.c)       - Doxygen, Unity Test, ANSI/C99/C11
+  • C#             (.cs)      - XML docs, NUnit, nullable references  
+  • PHP            (.php)     - PHPDoc, PHPUnit, type declarations
+  • Ruby           (.rb)      - YARD, RSpec, idiomatic patterns
+  • Go             (.go)      - Go docs, testing package, interfaces
+  • Rust           (.rs)      - Rust docs, built-in tests, ownership
+  • Swift          (.swift)   - Swift docs, XCTest
+  • Kotlin         (.kt)      - KDoc, JUnit integration
+  • Scala          (.scala)   - ScalaDoc, ScalaTest
+
+🌐 Web Technologies:
+  • HTML           (.html)    - Semantic markup, accessibility
+  • CSS            (.css)     - Modern CSS, responsive design
+  • SCSS/Sass      (.scss)    - Sass features, optimization  
+  • SQL            (.sql)     - Query optimization, security
+
+📄 Data & Configuration:
+  • JSON           (.json)    - Structure validation, schema
+  • XML            (.xml)     - Well-formed validation, XSD
+  • YAML           (.yaml)    - Configuration analysis
+  • TOML           (.toml)    - Configuration files
+  • Markdown       (.md)      - Documentation, formatting
+
+🔧 Scripts & Tools:
+  • Shell Scripts  (.sh)      - Bash/Zsh, best practices
+  • Batch Files    (.bat)     - Windows batch scripting
+  • PowerShell     (.ps1)     - PowerShell scripting
+  • Makefile       (Makefile) - Build system optimization
+
+📝 Text Files:
+  • Plain Text     (.txt)     - General text analysis
+  • Config Files   (.conf)    - Configuration analysis
+  • Log Files      (.log)     - Log pattern analysis
+
+🔄 Language-Specific Features:
+
+Python:           PEP compliance, type hints, context managers
+JavaScript:       ES6+, async/await, modern patterns  
+TypeScript:       Strict typing, interfaces, generics
+Java:             OOP patterns, streams, lambda expressions
+C++:              RAII, smart pointers, templates
+Rust:             Ownership, lifetimes, trait bounds
+Go:               Idiomatic patterns, goroutines, interfaces
+
+🚀 Coming Soon:
+  • Dart, Flutter  • R, Julia     • Haskell, F#
+  • Assembly       • Dockerfile   • Terraform
+  • More frameworks and DSLs!
+"""
+
+DOC_DESCRIPTION = """Generate language-appropriate documentation:
+  • Python: Google-style docstrings
+  • JavaScript/TypeScript: JSDoc/TSDoc comments
+  • Java: Javadoc comments
+  • C++/C: Doxygen comments
+  • C#: XML documentation comments
+  • PHP: PHPDoc comments
+  • Ruby: YARD documentation
+  • Go: Go doc comments
+  • Rust: Rust doc comments"""
+
+SUMMARIZE_DESCRIPTION = """Generate intelligent summaries including:
+  • Main purpose and functionality
+  • Key components (classes, functions, modules)
+  • Dependencies and imports
+  • Notable patterns and design decisions
+  • Architecture and structure overview"""
+
+TEST_DESCRIPTION = """Generate tests using appropriate frameworks:
+  • Python: pytest
+  • JavaScript: Jest
+  • TypeScript: Jest with TypeScript
+  • Java: JUnit
+  • C++: Google Test
+  • C#: NUnit/MSTest
+  • PHP: PHPUnit
+  • Ruby: RSpec
+  • Go: Go testing package
+  • Rust: Built-in test framework"""
+
+INSPECT_DESCRIPTION = """Comprehensive code analysis including:
+  • Logic errors and potential bugs
+  • Security vulnerabilities
+  • Performance bottlenecks
+  • Code smells and maintainability issues
+  • Language-specific best practice violations
+  • Memory management issues (for C/C++)
+  • Type safety concerns"""
+
+REFACTOR_DESCRIPTION = """Language-specific refactoring including:
+  • Code organization and structure
+  • Performance optimizations
+  • Modern language feature adoption
+  • Design pattern implementation
+  • Complexity reduction
+  • Following language conventions and best practices"""
+
+ANNOTATE_DESCRIPTION = """Add appropriate type annotations:
+  • Python: Type hints with typing module
+  • TypeScript: Interface and type annotations
+  • Java: Generic type declarations
+  • C++: Template and auto keyword usage
+  • C#: Nullable reference types
+  • Go: Interface and type declarations
+  • Rust: Type annotations and trait bounds
+  • PHP: Scalar and return type declarations
+  • JavaScript: JSDoc type comments"""
+
+MIGRATE_DESCRIPTION = """Migration capabilities:
+  • Language version upgrades (Python 2→3, ES5→ES6+, etc.)
+  • Cross-language conversion (Python↔JavaScript, etc.)
+  • Framework migrations (jQuery→React, etc.)
+  • API modernization
+  • Dependency updates
+  • Platform-specific adaptations"""
+
+CHAT_DESCRIPTION = """Interactive mode features:
+  • Natural language code queries
+  • Multi-file analysis
+  • Step-by-step guidance
+  • Code explanations and tutorials
+  • Best practice recommendations
+  • Real-time code assistance
+
+Commands in chat mode:
+  • doc <file>          - Generate documentation
+  • summarize <file>    - Summarize code
+  • test <file>         - Generate tests  
+  • inspect <file>      - Analyze for bugs
+  • refactor <file>     - Improve code
+  • annotate <file>     - Add type annotations
+  • migrate <file>      - Migrate code
+  • help               - Show available commands
+  • exit/quit          - Exit chat mode"""
+
+CHAT_WELCOME = """🌬️  Welcome to Breeze Interactive Mode!
+AI-powered multi-language code assistant
+
+"""
+
+CHAT_QUICK_START = """💡 Quick start:
+  • Type 'help' for available commands
+  • Type 'examples' for usage examples
+  • Type 'supported' for supported languages
+  • Type 'exit' or 'quit' to end session
+  • Ask questions like: 'analyze bugs in my_file.py'
+
+"""
@@ -0,0 +1,64 @@
+"""Content-addressed disk cache for prompt/response pairs."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class PromptCache:
+    """File-backed cache shared by all agent nodes.
+
+    Entries are keyed by a SHA-256 over model name, node class, and full
+    prompt text, so re-running a command on unchanged input returns the
+    stored response instead of paying the LLM round-trip. One file per
+    entry under ~/.breeze/cache keeps the implementation dependency-free;
+    set BREEZE_NO_CACHE to bypass entirely.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.enabled = not os.environ.get("BREEZE_NO_CACHE")
+        base = cache_dir or os.path.join(os.path.expanduser("~"), ".breeze", "cache")
+        self._dir = Path(base)
+        if self.enabled:
+            try:
+                self._dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                self.enabled = False
+
+    @staticmethod
+    def make_key(model_name: str, node_name: str, prompt: str) -> str:
+        """Content-address a call; NUL separators keep fields unambiguous."""
+        raw = f"{model_name}\x00{node_name}\x00{prompt}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        if not self.enabled:
+            return None
+        try:
+            return (self._dir / key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response; failures are silent (cache is best-effort)."""
+        if not self.enabled:
+            return
+        tmp = self._dir / f"{key}.tmp"
+        try:
+            tmp.write_text(value, encoding="utf-8")
+            os.replace(tmp, self._dir / key)
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Delete all cached entries; returns the number removed."""
+        removed = 0
+        try:
+            for entry in self._dir.iterdir():
+                entry.unlink(missing_ok=True)
+                removed += 1
+        except OSError:
+            pass
+        return removed
@@ -2,36 +2,232 @@
 
 import os
 import json
-from typing import Optional, Dict, Any
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+# The google.generativeai import alone costs hundreds of ms (grpc,
+# protobuf, google.auth), so it is loaded lazily on first proxy use
+# rather than at module import.
+genai = None
 
 try:
-    import google.generativeai as genai
+    import numpy as np
 except ImportError:
-    genai = None
+    np = None
+
+
+def _load_genai():
+    """Import the Gemini SDK on first use and cache it at module level."""
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai as genai_module
+        except ImportError:
+            raise ImportError(
+                "google-generativeai package not installed. Run: pip install google-generativeai"
+            )
+        genai = genai_module
+    return genai
+
+
+class PromptResponseCache:
+    """Two-tier cache for Gemini responses.
+
+    Deterministic calls (temperature <= 0) are cached by an exact SHA-256
+    key over the full request parameters. Sampled calls can optionally hit
+    a semantic tier that matches prompts by embedding cosine similarity.
+    """
+
+    EMBEDDING_MODEL = "models/text-embedding-004"
+
+    def __init__(self, maxsize: int = 1024, similarity_threshold: float = 0.92):
+        """Initialize the cache with a bounded exact tier and semantic tier."""
+        self.enabled = True
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.stats = {"hits": 0, "misses": 0}
+        self._exact: "OrderedDict[str, str]" = OrderedDict()
+        self._semantic: List[Tuple[List[float], str]] = []
+        self._matrix = None  # cached normalized embedding matrix (numpy only)
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, temperature: float, max_tokens: Optional[int]) -> str:
+        """Build a stable exact-match key for a request."""
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response for an exact key, or None on miss."""
+        if not self.enabled:
+            return None
+        cached = self._exact.get(key)
+        if cached is not None:
+            self._exact.move_to_end(key)
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+        return cached
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response under an exact key, evicting the oldest entry."""
+        if not self.enabled:
+            return
+        self._exact[key] = response
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+
+    def get_semantic(self, prompt: str) -> Optional[str]:
+        """Return a cached response whose prompt embedding is close enough.
+
+        With numpy available the whole lookup is a single matrix-vector
+        product over pre-normalized embeddings; otherwise it falls back to
+        a pure-Python scan.
+        """
+        if not self.enabled or not self._semantic:
+            return None
+        query = self._embed(prompt)
+        if query is None:
+            return None
+
+        if np is not None:
+            q = np.asarray(query, dtype=np.float32)
+            norm = np.linalg.norm(q)
+            if not norm:
+                return None
+            sims = self._semantic_matrix() @ (q / norm)
+            idx = int(sims.argmax())
+            best_score = float(sims[idx])
+            best_response = self._semantic[idx][1]
+        else:
+            best_score, best_response = -1.0, None
+            for vector, response in self._semantic:
+                score = _cosine_similarity(vector, query)
+                if score > best_score:
+                    best_score, best_response = score, response
+
+        if best_score >= self.similarity_threshold:
+            self.stats["hits"] += 1
+            return best_response
+        self.stats["misses"] += 1
+        return None
+
+    def put_semantic(self, prompt: str, response: str) -> None:
+        """Store a response keyed by the prompt's embedding."""
+        if not self.enabled:
+            return
+        vector = self._embed(prompt)
+        if vector is None:
+            return
+        self._semantic.append((vector, response))
+        if len(self._semantic) > self.maxsize:
+            self._semantic.pop(0)
+        self._matrix = None  # stale; rebuilt on next lookup
+
+    def _semantic_matrix(self):
+        """Return the L2-normalized embedding matrix, rebuilding if stale."""
+        if self._matrix is None:
+            matrix = np.asarray([v for v, _ in self._semantic], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+        return self._matrix
+
+    def _embed(self, prompt: str) -> Optional[List[float]]:
+        """Embed a prompt for semantic matching; None if unavailable."""
+        if genai is None:
+            return None
+        try:
+            result = genai.embed_content(model=self.EMBEDDING_MODEL, content=prompt)
+            return result["embedding"]
+        except Exception:
+            return None
+
+
+@functools.lru_cache(maxsize=64)
+def _gen_config(temperature: float, max_tokens: Optional[int]):
+    """Return a cached GenerationConfig for the given parameters."""
+    return genai.types.GenerationConfig(
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+    )
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Compute cosine similarity between two embedding vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(y * y for y in b) ** 0.5
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+# Process-wide proxy instances keyed by model name, so genai.configure and
+# the GenerativeModel handshake happen once per model rather than per caller.
+_PROXY_CACHE: Dict[str, "GeminiAPIProxy"] = {}
+_PROXY_LOCK = threading.Lock()
 
 
 class GeminiAPIProxy:
     """Proxy class for interacting with Google's Gemini API."""
-    
+
+    # Shared GenerativeModel handles keyed by model name. The SDK keeps one
+    # HTTP channel per model object, so reusing the handle across proxies
+    # keeps connections (and their TLS sessions) alive between calls.
+    _shared_models: Dict[str, Any] = {}
+    _shared_models_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model_name: str = "gemini-1.5-flash") -> "GeminiAPIProxy":
+        """Return the shared proxy for a model, creating it on first use."""
+        proxy = _PROXY_CACHE.get(model_name)
+        if proxy is None:
+            with _PROXY_LOCK:
+                proxy = _PROXY_CACHE.get(model_name)
+                if proxy is None:
+                    proxy = cls(model_name)
+                    _PROXY_CACHE[model_name] = proxy
+        return proxy
+
     def __init__(self, model_name: str = "gemini-1.5-flash"):
         """Initialize the Gemini API proxy."""
         self.model_name = model_name
         self.api_key = os.getenv("GEMINI_API_KEY")
         self.model = None
-        
+        self.cache = PromptResponseCache()
+        self._contextual_models: Dict[str, Any] = {}
+        self._inflight: Dict[str, Any] = {}  # request key -> asyncio.Future
+
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
-        
-        if genai is None:
-            raise ImportError("google-generativeai package not installed. Run: pip install google-generativeai")
-        
+
+        _load_genai()
         self._initialize_model()
     
     def _initialize_model(self) -> None:
-        """Initialize the Gemini model."""
+        """Initialize the Gemini model, reusing a shared handle per model name."""
         try:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.model_name)
+            model = self._shared_models.get(self.model_name)
+            if model is None:
+                with self._shared_models_lock:
+                    model = self._shared_models.get(self.model_name)
+                    if model is None:
+                        genai.configure(api_key=self.api_key)
+                        model = genai.GenerativeModel(self.model_name)
+                        self._shared_models[self.model_name] = model
+            self.model = model
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Gemini model: {e}")
     
@@ -56,18 +252,29 @@ class GeminiAPIProxy:
         """
         if not self.model:
             raise RuntimeError("Gemini model not initialized")
-        
+
+        # Check the cache before paying a network round-trip: exact match
+        # for deterministic calls, semantic match otherwise.
+        cache_key = None
+        if self.cache.enabled:
+            if temperature <= 0:
+                cache_key = self.cache.make_key(self.model_name, prompt, temperature, max_tokens)
+                cached = self.cache.get(cache_key)
+            else:
+                cached = self.cache.get_semantic(prompt)
+            if cached is not None:
+                if verbose:
+                    print(f"Cache hit for Gemini model: {self.model_name}")
+                return cached
+
         try:
             if verbose:
                 print(f"Calling Gemini model: {self.model_name}")
                 print(f"Prompt length: {len(prompt)} characters")
-            
-            # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            )
-            
+
+            # Configure generation parameters (cached per parameter pair)
+            generation_config = _gen_config(temperature, max_tokens)
+
             # Generate response
             response = self.model.generate_content(
                 prompt,
@@ -79,7 +286,12 @@ class GeminiAPIProxy:
                 
                 if verbose:
                     print(f"Response length: {len(result)} characters")
-                
+
+                if cache_key is not None:
+                    self.cache.put(cache_key, result)
+                elif self.cache.enabled:
+                    self.cache.put_semantic(prompt, result)
+
                 return result
             else:
                 return "No response generated from Gemini API"
@@ -89,25 +301,228 @@ class GeminiAPIProxy:
                 print(f"Gemini API error: {e}")
             raise RuntimeError(f"Gemini API call failed: {e}")
     
+    def stream_gemini(
+        self,
+        prompt: str,
+        verbose: bool = False,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a Gemini response chunk by chunk instead of buffering it.
+
+        Time-to-first-byte drops from full-generation latency to roughly
+        one chunk, letting callers print or write output while the model
+        is still generating.
+
+        Args:
+            prompt: The input prompt for the model
+            verbose: Whether to print debug information
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Response text chunks in generation order
+        """
+        if not self.model:
+            raise RuntimeError("Gemini model not initialized")
+
+        try:
+            if verbose:
+                print(f"Streaming from Gemini model: {self.model_name}")
+
+            response = self.model.generate_content(
+                prompt,
+                generation_config=_gen_config(temperature, max_tokens),
+                stream=True
+            )
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            if verbose:
+                print(f"Gemini API error: {e}")
+            raise RuntimeError(f"Gemini API call failed: {e}")
+
+    async def acall_gemini(
+        self,
+        prompt: str,
+        verbose: bool = False,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Async variant of call_gemini using the SDK's generate_content_async.
+
+        Shares the same response cache as the synchronous path.
+
+        Args:
+            prompt: The input prompt for the model
+            verbose: Whether to print debug information
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The model's response as a string
+        """
+        if not self.model:
+            raise RuntimeError("Gemini model not initialized")
+
+        cache_key = None
+        request_key = self.cache.make_key(self.model_name, prompt, temperature, max_tokens)
+        if self.cache.enabled and temperature <= 0:
+            cache_key = request_key
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Singleflight: if an identical request is already in flight
+        # (common when a batch fans out over boilerplate files), await its
+        # result instead of issuing a duplicate API call.
+        import asyncio
+
+        existing = self._inflight.get(request_key)
+        if existing is not None:
+            return await existing
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request_key] = future
+        try:
+            generation_config = _gen_config(temperature, max_tokens)
+
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=generation_config
+            )
+
+            if response.candidates and response.candidates[0].content:
+                result = response.candidates[0].content.parts[0].text
+                if cache_key is not None:
+                    self.cache.put(cache_key, result)
+            else:
+                result = "No response generated from Gemini API"
+
+            future.set_result(result)
+            return result
+
+        except Exception as e:
+            error = RuntimeError(f"Gemini API call failed: {e}")
+            if not future.done():
+                future.set_exception(error)
+                # Suppress "exception never retrieved" if nobody else waits.
+                future.exception()
+            if verbose:
+                print(f"Gemini API error: {e}")
+            raise error
+        finally:
+            # If the leader was cancelled, the except arm above never
+            # ran; cancel the future so coalesced waiters wake instead
+            # of hanging on a popped, unresolved future.
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(request_key, None)
+
+    def call_gemini_batch(
+        self,
+        prompts: List[str],
+        verbose: bool = False,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None
+    ) -> List[str]:
+        """
+        Call the Gemini API for several prompts in one go.
+
+        Prompts are issued concurrently via the SDK's async API so the
+        wall-clock cost approaches a single round-trip instead of N
+        sequential ones. Falls back to sequential calls if no event loop
+        can be used.
+
+        Args:
+            prompts: Input prompts, one per request
+            verbose: Whether to print debug information
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate per response
+
+        Returns:
+            Responses in the same order as the input prompts
+        """
+        if not prompts:
+            return []
+
+        if not self.model:
+            raise RuntimeError("Gemini model not initialized")
+
+        if verbose:
+            print(f"Calling Gemini model: {self.model_name} with {len(prompts)} prompts")
+
+        import asyncio
+
+        async def _gather() -> List[str]:
+            generation_config = _gen_config(temperature, max_tokens)
+
+            async def _one(prompt: str) -> str:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config
+                )
+                if response.candidates and response.candidates[0].content:
+                    return response.candidates[0].content.parts[0].text
+                return "No response generated from Gemini API"
+
+            return list(await asyncio.gather(*[_one(p) for p in prompts]))
+
+        try:
+            return asyncio.run(_gather())
+        except RuntimeError:
+            # Already inside an event loop (or async API unavailable):
+            # fall back to sequential calls.
+            return [
+                self.call_gemini(p, verbose=verbose, temperature=temperature, max_tokens=max_tokens)
+                for p in prompts
+            ]
+
     def call_gemini_with_context(
-        self, 
+        self,
         system_prompt: str,
         user_prompt: str,
         verbose: bool = False
     ) -> str:
         """
         Call Gemini with separate system and user prompts.
-        
+
+        The system prompt is passed as a system_instruction on a cached
+        per-(model, system_prompt) GenerativeModel, so the static prefix
+        stays byte-identical across calls and provider-side prompt caching
+        can kick in; only the user prompt varies.
+
         Args:
             system_prompt: System/context prompt
             user_prompt: User's actual prompt
             verbose: Whether to print debug information
-            
+
         Returns:
             The model's response as a string
         """
-        combined_prompt = f"{system_prompt}\n\nUser: {user_prompt}\n\nAssistant:"
-        return self.call_gemini(combined_prompt, verbose=verbose)
+        try:
+            model = self._contextual_models.get(system_prompt)
+            if model is None:
+                model = genai.GenerativeModel(
+                    self.model_name,
+                    system_instruction=system_prompt
+                )
+                self._contextual_models[system_prompt] = model
+
+            if verbose:
+                print(f"Calling Gemini model: {self.model_name} (with system instruction)")
+
+            response = model.generate_content(user_prompt)
+            if response.candidates and response.candidates[0].content:
+                return response.candidates[0].content.parts[0].text
+            return "No response generated from Gemini API"
+        except Exception as e:
+            if verbose:
+                print(f"Gemini API error: {e}")
+            raise RuntimeError(f"Gemini API call failed: {e}")
     
     def is_available(self) -> bool:
         """Check if the Gemini API is available and configured."""
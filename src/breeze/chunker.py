@@ -0,0 +1,73 @@
+"""Split oversized source files at top-level structure boundaries."""
+
+import ast
+import re
+from typing import List
+
+# Unindented line ending in an opening brace: a top-level function,
+# class, or block in C-family syntax.
+_C_BOUNDARY_RE = re.compile(r'^\S.*\{\s*$', re.MULTILINE)
+
+_C_FAMILY = frozenset([
+    "javascript", "typescript", "java", "cpp", "c", "csharp", "go", "rust", "php"
+])
+
+
+def split_by_toplevel(content: str, file_type: str = "text", max_tokens: int = 4000) -> List[str]:
+    """Split content into chunks of roughly max_tokens (~4 chars each).
+
+    Python splits at top-level statement boundaries from ast.parse;
+    C-family sources split at unindented `... {` lines; anything else
+    (or unparseable Python) falls back to cutting at line breaks.
+    Returns [content] unchanged when it already fits in one chunk.
+    """
+    max_chars = max_tokens * 4
+    if len(content) <= max_chars:
+        return [content]
+
+    if file_type == "python":
+        bounds = _python_boundaries(content)
+    elif file_type in _C_FAMILY:
+        bounds = [m.start() for m in _C_BOUNDARY_RE.finditer(content)]
+    else:
+        bounds = []
+
+    return _group(content, bounds, max_chars)
+
+
+def _python_boundaries(content: str) -> List[int]:
+    """Character offsets of each top-level statement, or [] on bad syntax."""
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return []
+
+    starts = [0]
+    for line in content.splitlines(keepends=True):
+        starts.append(starts[-1] + len(line))
+    return [starts[node.lineno - 1] for node in tree.body]
+
+
+def _group(content: str, bounds: List[int], max_chars: int) -> List[str]:
+    """Group sibling segments until each chunk approaches max_chars."""
+    if not bounds:
+        # No structural boundaries: cut at the last newline before the
+        # budget so lines stay intact.
+        chunks = []
+        pos = 0
+        while pos < len(content):
+            end = content.rfind('\n', pos, pos + max_chars)
+            if end <= pos:
+                end = min(pos + max_chars, len(content))
+            chunks.append(content[pos:end])
+            pos = end
+        return chunks
+
+    chunks = []
+    start = 0
+    for bound in bounds:
+        if bound > start and bound - start >= max_chars:
+            chunks.append(content[start:bound])
+            start = bound
+    chunks.append(content[start:])
+    return [chunk for chunk in chunks if chunk.strip()] or [content]
@@ -1,35 +1,162 @@
 """Flow orchestration and coordination logic."""
 
 import os
+import re
+import asyncio
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-from .nodes import (
-    DocAgentNode, SummaryAgentNode, TestGenerationAgentNode,
-    BugDetectionAgentNode, RefactorCodeAgentNode, TypeAnnotationAgentNode,
-    MigrationAgentNode, OrchestratorNode, FileManagementNode,
-    SafetyCheckNode, ContextAwarenessNode, ErrorHandlingNode
-)
 from .utils import read_file_content, write_file_content, get_output_filename
 
+# Lexical fast path for chat intents: inputs that plainly name a command
+# and a file are dispatched without an LLM round-trip. Compiled once at
+# import so each chat turn is a single scan.
+_INTENT_KEYWORD_RE = re.compile(
+    r'\b(doc(?:ument)?|summari[sz]e|test|inspect|bug|refactor|annotat\w*|migrat\w*)\b',
+    re.IGNORECASE
+)
+_INTENT_PATH_RE = re.compile(
+    r'(\S+\.(?:py|js|ts|java|cpp|c|cs|php|rb|go|rs|swift|kt|scala|html|css|sql|json|xml|yaml|yml|md|txt|sh|bat|ps1))\b',
+    re.IGNORECASE
+)
+_INTENT_TARGET_RE = re.compile(r'--target\s+["\']?([^"\']+)["\']?')
+
+_KEYWORD_TO_COMMAND = {
+    "doc": "doc", "document": "doc",
+    "summarize": "summarize", "summarise": "summarize",
+    "test": "test",
+    "inspect": "inspect", "bug": "inspect",
+    "refactor": "refactor",
+}
+
+
+def _lexical_intent(user_input: str) -> Optional[Dict[str, Any]]:
+    """Extract a chat intent lexically; None when the input is ambiguous."""
+    match = _INTENT_KEYWORD_RE.search(user_input)
+    if not match:
+        return None
+
+    keyword = match.group(1).lower()
+    if keyword.startswith("annotat"):
+        command = "annotate"
+    elif keyword.startswith("migrat"):
+        command = "migrate"
+    else:
+        command = _KEYWORD_TO_COMMAND.get(keyword)
+    if command is None:
+        return None
+
+    intent: Dict[str, Any] = {"command": command}
+    path_match = _INTENT_PATH_RE.search(user_input)
+    if path_match:
+        intent["path"] = path_match.group(1)
+
+    low = user_input.lower()
+    if "in-place" in low:
+        intent["output_mode"] = "in-place"
+    elif "new-file" in low:
+        intent["output_mode"] = "new-file"
+    if "secure" in low or "confirm" in low:
+        intent["secure"] = True
+
+    if command == "migrate":
+        target_match = _INTENT_TARGET_RE.search(user_input)
+        if not target_match:
+            return None  # migrate without a clear target: defer to the LLM
+        intent["target"] = target_match.group(1)
+
+    # Only trust the lexical parse when it found a concrete file to act
+    # on; otherwise let the orchestrator's richer parsing decide.
+    if "path" not in intent:
+        return None
+    return intent
+
 
 class FlowOrchestrator:
-    """Main orchestrator for managing agent flows and task coordination."""
-    
+    """Main orchestrator for managing agent flows and task coordination.
+
+    Agent nodes are created lazily on first use so that constructing the
+    orchestrator (and importing this module) stays cheap; a single-command
+    invocation only pays for the nodes it actually touches.
+    """
+
+    # Maps CLI command names to the lazy agent attributes above. Built once
+    # at class level so dispatch is a single dict lookup and only the
+    # requested agent ever materializes.
+    _COMMAND_TO_ATTR = {
+        "doc": "doc_agent",
+        "summarize": "summary_agent",
+        "test": "test_agent",
+        "inspect": "bug_agent",
+        "refactor": "refactor_agent",
+        "annotate": "type_agent",
+        "migrate": "migration_agent",
+    }
+
     def __init__(self):
-        """Initialize the flow orchestrator with all agent nodes."""
-        self.doc_agent = DocAgentNode()
-        self.summary_agent = SummaryAgentNode()
-        self.test_agent = TestGenerationAgentNode()
-        self.bug_agent = BugDetectionAgentNode()
-        self.refactor_agent = RefactorCodeAgentNode()
-        self.type_agent = TypeAnnotationAgentNode()
-        self.migration_agent = MigrationAgentNode()
-        self.orchestrator = OrchestratorNode()
-        self.file_manager = FileManagementNode()
-        self.safety_check = SafetyCheckNode()
-        self.context_aware = ContextAwarenessNode()
-        self.error_handler = ErrorHandlingNode()
+        """Initialize the orchestrator; agent nodes are created on demand."""
+        self._context_cache: Dict[Any, Dict[str, Any]] = {}
+
+    @cached_property
+    def doc_agent(self):
+        from .nodes import DocAgentNode
+        return DocAgentNode()
+
+    @cached_property
+    def summary_agent(self):
+        from .nodes import SummaryAgentNode
+        return SummaryAgentNode()
+
+    @cached_property
+    def test_agent(self):
+        from .nodes import TestGenerationAgentNode
+        return TestGenerationAgentNode()
+
+    @cached_property
+    def bug_agent(self):
+        from .nodes import BugDetectionAgentNode
+        return BugDetectionAgentNode()
+
+    @cached_property
+    def refactor_agent(self):
+        from .nodes import RefactorCodeAgentNode
+        return RefactorCodeAgentNode()
+
+    @cached_property
+    def type_agent(self):
+        from .nodes import TypeAnnotationAgentNode
+        return TypeAnnotationAgentNode()
+
+    @cached_property
+    def migration_agent(self):
+        from .nodes import MigrationAgentNode
+        return MigrationAgentNode()
+
+    @cached_property
+    def orchestrator(self):
+        from .nodes import OrchestratorNode
+        return OrchestratorNode()
+
+    @cached_property
+    def file_manager(self):
+        from .nodes import FileManagementNode
+        return FileManagementNode()
+
+    @cached_property
+    def safety_check(self):
+        from .nodes import SafetyCheckNode
+        return SafetyCheckNode()
+
+    @cached_property
+    def context_aware(self):
+        from .nodes import ContextAwarenessNode
+        return ContextAwarenessNode()
+
+    @cached_property
+    def error_handler(self):
+        from .nodes import ErrorHandlingNode
+        return ErrorHandlingNode()
     
     def process_command(
         self,
@@ -40,53 +167,253 @@ class FlowOrchestrator:
         verbose: bool = False,
         target: Optional[str] = None
     ) -> str:
-        """Process a CLI command through the appropriate agent flow."""
-        try:
-            # Read file content if path is provided
-            file_content = None
-            if path:
+        """Process a CLI command through the appropriate agent flow.
+
+        Only the genuinely fallible steps (file I/O and the agent/LLM
+        call) are guarded; programmer errors propagate instead of being
+        swallowed by a broad catch-all.
+        """
+        # Read file content if path is provided
+        file_content = None
+        if path:
+            try:
                 file_content = read_file_content(path)
-                if verbose:
-                    print(f"Read {len(file_content)} characters from {path}")
-            
-            # Add context awareness
-            context = self.context_aware.analyze_context(file_content, path)
-            if verbose and context:
-                print(f"Context analysis: {context}")
-            
-            # Route to appropriate agent
+            except (OSError, RuntimeError) as e:
+                return self.error_handler.handle_error(e, command, path, verbose)
+            if verbose:
+                print(f"Read {len(file_content)} characters from {path}")
+
+        # Add context awareness (memoized per unchanged content)
+        context = self._analyze_context_cached(file_content, path)
+        if verbose and context:
+            print(f"Context analysis: {context}")
+
+        # Route to appropriate agent
+        try:
             result = self._route_command(command, file_content, path, target, verbose)
-            
-            # Apply safety checks if modifications are involved
-            if secure and command in ["refactor", "annotate", "migrate"]:
-                if not self.safety_check.approve_changes(result, verbose):
-                    return "Operation cancelled by user."
-            
-            # Handle output based on mode
+        except (OSError, RuntimeError, ValueError) as e:
+            return self.error_handler.handle_error(e, command, path, verbose)
+
+        # Apply safety checks if modifications are involved
+        if secure and command in ["refactor", "annotate", "migrate"]:
+            if not self.safety_check.approve_changes(result, verbose):
+                return "Operation cancelled by user."
+
+        # Handle output based on mode
+        try:
             return self._handle_output(result, path, output_mode, command, verbose)
-            
-        except Exception as e:
+        except (OSError, RuntimeError) as e:
             return self.error_handler.handle_error(e, command, path, verbose)
     
+    def _analyze_context_cached(self, content: Optional[str], path: Optional[str]) -> Dict[str, Any]:
+        """Memoized wrapper around ContextAwarenessNode.analyze_context.
+
+        Chat sessions re-analyze the same file on every turn; caching by
+        (path, content hash) makes repeat analysis a dict hit. CPython
+        caches str hashes, so hashing the same cached content is cheap.
+        """
+        if content is None:
+            return self.context_aware.analyze_context(content, path)
+
+        key = (path, len(content), hash(content))
+        cached = self._context_cache.get(key)
+        if cached is None:
+            cached = self.context_aware.analyze_context(content, path)
+            if len(self._context_cache) >= 64:
+                self._context_cache.pop(next(iter(self._context_cache)))
+            self._context_cache[key] = cached
+        return cached
+
+    async def aprocess_command(
+        self,
+        command: str,
+        path: Optional[str] = None,
+        output_mode: str = "console",
+        secure: bool = False,
+        verbose: bool = False,
+        target: Optional[str] = None
+    ) -> str:
+        """Async wrapper around process_command, safe to fan out with gather."""
+        return await asyncio.to_thread(
+            self.process_command,
+            command=command,
+            path=path,
+            output_mode=output_mode,
+            secure=secure,
+            verbose=verbose,
+            target=target
+        )
+
+    def process_paths(
+        self,
+        command: str,
+        paths: List[str],
+        output_mode: str = "console",
+        secure: bool = False,
+        verbose: bool = False,
+        target: Optional[str] = None,
+        max_concurrency: int = 10
+    ) -> List[str]:
+        """Process a command over several files concurrently.
+
+        Each file is handled by aprocess_command; concurrency is bounded by
+        a semaphore to respect API quotas. Results come back in the same
+        order as the input paths.
+        """
+        async def _run() -> List[str]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _one(p: str) -> str:
+                async with semaphore:
+                    return await self.aprocess_command(
+                        command, path=p, output_mode=output_mode,
+                        secure=secure, verbose=verbose, target=target
+                    )
+
+            return list(await asyncio.gather(*[_one(p) for p in paths]))
+
+        return asyncio.run(_run())
+
+    async def aprocess_commands(
+        self,
+        commands: List[str],
+        path: Optional[str] = None,
+        verbose: bool = False,
+        target: Optional[str] = None
+    ) -> str:
+        """Run several independent commands against one file concurrently.
+
+        The file is read once, each agent runs in parallel (agents are
+        stateless per call), and the outputs are aggregated under one
+        section header per command.
+        """
+        file_content = None
+        if path:
+            file_content = await asyncio.to_thread(read_file_content, path)
+
+        results = await asyncio.gather(*[
+            asyncio.to_thread(self._route_command, c, file_content, path, target, verbose)
+            for c in commands
+        ])
+
+        sections = [
+            f"=== {command} ===\n{result}"
+            for command, result in zip(commands, results)
+        ]
+        return "\n\n".join(sections)
+
+    def process_commands(
+        self,
+        commands: List[str],
+        path: Optional[str] = None,
+        verbose: bool = False,
+        target: Optional[str] = None
+    ) -> str:
+        """Synchronous entry point for aprocess_commands."""
+        return asyncio.run(self.aprocess_commands(commands, path, verbose, target))
+
+    def process_batch(
+        self,
+        items: List[Dict[str, Any]],
+        verbose: bool = False
+    ) -> List[str]:
+        """Run several tasks through one batched Gemini submission.
+
+        Each item is a dict with "command", optional "path", and optional
+        "target". Prompts are collected from the agents' build_prompt and
+        submitted together via call_gemini_batch, so the network
+        round-trips overlap instead of serializing one HTTPS call per
+        task. Items whose node cannot produce a prompt (missing content,
+        unsupported type) fall back to process() for its usual message.
+        Results come back in input order. Each prompt goes through the
+        same disk cache and token bucket as the single-call path, so a
+        batch neither re-pays for cached responses nor bursts past
+        BREEZE_RPM/BREEZE_TPM.
+        """
+        from .call_gemini import GeminiAPIProxy
+        from .ratelimit import get_bucket
+
+        results: List[Optional[str]] = [None] * len(items)
+        prompts: List[str] = []
+        slots: List[int] = []
+        cache_keys: List[tuple] = []
+
+        for i, item in enumerate(items):
+            command = item["command"]
+            attr = self._COMMAND_TO_ATTR.get(command)
+            if attr is None:
+                results[i] = f"Unknown command: {command}"
+                continue
+            agent = getattr(self, attr)
+
+            path = item.get("path")
+            target = item.get("target")
+            content = None
+            if path:
+                try:
+                    content = read_file_content(path)
+                except (OSError, RuntimeError) as e:
+                    results[i] = self.error_handler.handle_error(e, command, path, verbose)
+                    continue
+
+            prompt = agent.build_prompt(content, path, target=target)
+            if prompt is None:
+                results[i] = agent.process(content, path, target=target, verbose=verbose)
+                continue
+
+            # Same key shape as BaseAgentNode._invoke, so batch and
+            # single-call runs share cache entries.
+            key = agent.cache.make_key(
+                agent.gemini.model_name, type(agent).__name__, prompt)
+            cached = agent.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+
+            prompts.append(prompt)
+            slots.append(i)
+            cache_keys.append((agent, key))
+
+        if prompts:
+            # Meter every prompt before the fan-out; consume blocks
+            # until the bucket can cover it, same as the node paths.
+            bucket = get_bucket()
+            for prompt in prompts:
+                bucket.consume(1, len(prompt) // 4)
+
+            responses = GeminiAPIProxy.get().call_gemini_batch(prompts, verbose=verbose)
+            for (agent, key), i, response in zip(cache_keys, slots, responses):
+                agent.cache.put(key, response)
+                results[i] = response
+
+        return results
+
     def process_chat_input(self, user_input: str, verbose: bool = False) -> str:
         """Process natural language input in chat mode."""
+        # Fast path: unambiguous "command + file" inputs skip the LLM.
+        intent = _lexical_intent(user_input)
+        if intent is None:
+            try:
+                # Use orchestrator to understand intent
+                intent = self.orchestrator.parse_intent(user_input, verbose)
+            except (OSError, RuntimeError, ValueError) as e:
+                return self.error_handler.handle_error(e, "chat", None, verbose)
+        elif verbose:
+            print(f"Matched intent lexically: {intent}")
+
+        if intent.get("command"):
+            return self.process_command(
+                command=intent["command"],
+                path=intent.get("path"),
+                output_mode=intent.get("output_mode", "console"),
+                secure=intent.get("secure", False),
+                verbose=verbose,
+                target=intent.get("target")
+            )
+
         try:
-            # Use orchestrator to understand intent
-            intent = self.orchestrator.parse_intent(user_input, verbose)
-            
-            if intent.get("command"):
-                return self.process_command(
-                    command=intent["command"],
-                    path=intent.get("path"),
-                    output_mode=intent.get("output_mode", "console"),
-                    secure=intent.get("secure", False),
-                    verbose=verbose,
-                    target=intent.get("target")
-                )
-            else:
-                return self.orchestrator.handle_general_query(user_input, verbose)
-                
-        except Exception as e:
+            return self.orchestrator.handle_general_query(user_input, verbose)
+        except (OSError, RuntimeError, ValueError) as e:
             return self.error_handler.handle_error(e, "chat", None, verbose)
     
     def _route_command(
@@ -98,19 +425,10 @@ class FlowOrchestrator:
         verbose: bool
     ) -> str:
         """Route command to the appropriate agent node."""
-        agents = {
-            "doc": self.doc_agent,
-            "summarize": self.summary_agent,
-            "test": self.test_agent,
-            "inspect": self.bug_agent,
-            "refactor": self.refactor_agent,
-            "annotate": self.type_agent,
-            "migrate": self.migration_agent
-        }
-        
-        agent = agents.get(command)
-        if not agent:
+        attr = self._COMMAND_TO_ATTR.get(command)
+        if attr is None:
             raise ValueError(f"Unknown command: {command}")
+        agent = getattr(self, attr)
         
         # Special handling for migration agent
         if command == "migrate" and target:
@@ -126,17 +444,32 @@ class FlowOrchestrator:
         command: str,
         verbose: bool
     ) -> str:
-        """Handle output based on the specified mode."""
+        """Handle output based on the specified mode.
+
+        Accepts either a full string or an iterator of chunks (from a
+        streaming agent); chunks are written incrementally so output
+        overlaps with generation.
+        """
         if output_mode == "console":
+            if not isinstance(result, str):
+                import sys
+                for chunk in result:
+                    sys.stdout.write(chunk)
+                sys.stdout.write("\n")
+                return ""
             return result
         elif output_mode == "in-place" and path:
             if command in ["doc", "refactor", "annotate", "migrate"]:
+                if not isinstance(result, str):
+                    result = "".join(result)
                 write_file_content(path, result)
                 return f"Changes applied to {path}"
             else:
                 return "In-place output not supported for this command. Use console or new-file."
         elif output_mode == "new-file" and path:
             output_path = get_output_filename(path, command)
+            if not isinstance(result, str):
+                result = "".join(result)
             write_file_content(output_path, result)
             return f"Output saved to {output_path}"
         else:
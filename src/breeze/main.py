@@ -1,23 +1,21 @@
 """Main entry point and CLI interface for Breeze."""
 
-import argparse
+from __future__ import annotations
+
+import os
+import stat
 import sys
 from pathlib import Path
 from typing import Optional, List
 
-from .flow import FlowOrchestrator
-from .utils import (
-    setup_logging, 
-    validate_file_path, 
-    get_api_key,
-    get_file_type,
-    get_file_extension
-)
+# argparse, .flow, and .utils are imported inside the functions that need
+# them so the common invocation shapes never pay their cost.
 
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+def _make_root_parser() -> argparse.ArgumentParser:
+    """Create the root parser with global options only."""
+    import argparse
     parser = argparse.ArgumentParser(
         prog="breeze",
         description="""AI-powered code understanding and transformation tool for multiple programming languages.
@@ -44,10 +42,17 @@ Examples:
         epilog="""For more information and examples, visit: https://ai.google.dev/
 Set your API key: export GEMINI_API_KEY=your_api_key (Linux/macOS) or set GEMINI_API_KEY "your_api_key" (Windows)"""
     )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands", metavar="COMMAND")
-    
-    # Common arguments for all subcommands
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="%(prog)s 0.1.0"
+    )
+    return parser
+
+
+def _make_common_parser() -> argparse.ArgumentParser:
+    """Create the parent parser holding arguments shared by all subcommands."""
+    import argparse
     common_parser = argparse.ArgumentParser(add_help=False)
     common_parser.add_argument(
         "--output", 
@@ -65,137 +70,105 @@ Set your API key: export GEMINI_API_KEY=your_api_key (Linux/macOS) or set GEMINI
         action="store_true",
         help="Enable detailed logging and processing information"
     )
-    
-    # Documentation generation command
+    return common_parser
+
+
+def _subcmd_description(name: str) -> Optional[str]:
+    """Return a subcommand's long description, but only for help output.
+
+    argparse formats description strings only when printing help, so on a
+    normal parse we pass None and skip loading the text entirely.
+    """
+    if "-h" not in sys.argv and "--help" not in sys.argv:
+        return None
+    from . import _help_texts
+    return getattr(_help_texts, name)
+
+
+def _build_doc_parser(subparsers, common_parser) -> None:
     doc_parser = subparsers.add_parser(
         "doc", 
         parents=[common_parser],
         help="Generate documentation for functions, classes, and modules",
-        description="""Generate language-appropriate documentation:
-  • Python: Google-style docstrings
-  • JavaScript/TypeScript: JSDoc/TSDoc comments
-  • Java: Javadoc comments
-  • C++/C: Doxygen comments
-  • C#: XML documentation comments
-  • PHP: PHPDoc comments
-  • Ruby: YARD documentation
-  • Go: Go doc comments
-  • Rust: Rust doc comments"""
+        description=_subcmd_description("DOC_DESCRIPTION")
     )
     doc_parser.add_argument(
         "path", 
         help="Path to source code file (supports: .py, .js, .ts, .java, .cpp, .c, .cs, .php, .rb, .go, .rs, etc.)"
     )
-    
-    # Code summarization command
+
+
+def _build_summarize_parser(subparsers, common_parser) -> None:
     summarize_parser = subparsers.add_parser(
         "summarize", 
         parents=[common_parser],
         help="Create concise summaries of code files",
-        description="""Generate intelligent summaries including:
-  • Main purpose and functionality
-  • Key components (classes, functions, modules)
-  • Dependencies and imports
-  • Notable patterns and design decisions
-  • Architecture and structure overview"""
+        description=_subcmd_description("SUMMARIZE_DESCRIPTION")
     )
     summarize_parser.add_argument(
         "path", 
         help="Path to any source code or configuration file"
     )
-    
-    # Test generation command
+
+
+def _build_test_parser(subparsers, common_parser) -> None:
     test_parser = subparsers.add_parser(
         "test", 
         parents=[common_parser],
         help="Generate comprehensive unit tests",
-        description="""Generate tests using appropriate frameworks:
-  • Python: pytest
-  • JavaScript: Jest
-  • TypeScript: Jest with TypeScript
-  • Java: JUnit
-  • C++: Google Test
-  • C#: NUnit/MSTest
-  • PHP: PHPUnit
-  • Ruby: RSpec
-  • Go: Go testing package
-  • Rust: Built-in test framework"""
+        description=_subcmd_description("TEST_DESCRIPTION")
     )
     test_parser.add_argument(
         "path", 
         help="Path to source code file to generate tests for"
     )
-    
-    # Bug detection and code inspection command
+
+
+def _build_inspect_parser(subparsers, common_parser) -> None:
     inspect_parser = subparsers.add_parser(
         "inspect", 
         parents=[common_parser],
         help="Detect bugs, security issues, and code quality problems",
-        description="""Comprehensive code analysis including:
-  • Logic errors and potential bugs
-  • Security vulnerabilities
-  • Performance bottlenecks
-  • Code smells and maintainability issues
-  • Language-specific best practice violations
-  • Memory management issues (for C/C++)
-  • Type safety concerns"""
+        description=_subcmd_description("INSPECT_DESCRIPTION")
     )
     inspect_parser.add_argument(
         "path", 
         help="Path to source code file to analyze"
     )
-    
-    # Code refactoring command
+
+
+def _build_refactor_parser(subparsers, common_parser) -> None:
     refactor_parser = subparsers.add_parser(
         "refactor", 
         parents=[common_parser],
         help="Improve code structure, readability, and maintainability",
-        description="""Language-specific refactoring including:
-  • Code organization and structure
-  • Performance optimizations
-  • Modern language feature adoption
-  • Design pattern implementation
-  • Complexity reduction
-  • Following language conventions and best practices"""
+        description=_subcmd_description("REFACTOR_DESCRIPTION")
     )
     refactor_parser.add_argument(
         "path", 
         help="Path to source code file to refactor"
     )
-    
-    # Type annotation command
+
+
+def _build_annotate_parser(subparsers, common_parser) -> None:
     annotate_parser = subparsers.add_parser(
         "annotate", 
         parents=[common_parser],
         help="Add or improve type annotations/declarations",
-        description="""Add appropriate type annotations:
-  • Python: Type hints with typing module
-  • TypeScript: Interface and type annotations
-  • Java: Generic type declarations
-  • C++: Template and auto keyword usage
-  • C#: Nullable reference types
-  • Go: Interface and type declarations
-  • Rust: Type annotations and trait bounds
-  • PHP: Scalar and return type declarations
-  • JavaScript: JSDoc type comments"""
+        description=_subcmd_description("ANNOTATE_DESCRIPTION")
     )
     annotate_parser.add_argument(
         "path", 
         help="Path to source code file (works with statically typed or type-aware languages)"
     )
-    
-    # Code migration command
+
+
+def _build_migrate_parser(subparsers, common_parser) -> None:
     migrate_parser = subparsers.add_parser(
         "migrate", 
         parents=[common_parser],
         help="Migrate code to newer versions, different languages, or frameworks (may not give the best possible results)",
-        description="""Migration capabilities:
-  • Language version upgrades (Python 2→3, ES5→ES6+, etc.)
-  • Cross-language conversion (Python↔JavaScript, etc.)
-  • Framework migrations (jQuery→React, etc.)
-  • API modernization
-  • Dependency updates
-  • Platform-specific adaptations"""
+        description=_subcmd_description("MIGRATE_DESCRIPTION")
     )
     migrate_parser.add_argument(
         "path", 
@@ -207,230 +180,297 @@ Set your API key: export GEMINI_API_KEY=your_api_key (Linux/macOS) or set GEMINI
         help='Migration target (examples: "Python 3.12", "TypeScript", "React", "Java 17", "C++20")',
         metavar="TARGET"
     )
-    
-    # Interactive chat mode
+
+
+def _build_chat_parser(subparsers, common_parser) -> None:
     chat_parser = subparsers.add_parser(
         "chat", 
         help="Start interactive multi-language code assistant",
-        description="""Interactive mode features:
-  • Natural language code queries
-  • Multi-file analysis
-  • Step-by-step guidance
-  • Code explanations and tutorials
-  • Best practice recommendations
-  • Real-time code assistance
-
-Commands in chat mode:
-  • doc <file>          - Generate documentation
-  • summarize <file>    - Summarize code
-  • test <file>         - Generate tests  
-  • inspect <file>      - Analyze for bugs
-  • refactor <file>     - Improve code
-  • annotate <file>     - Add type annotations
-  • migrate <file>      - Migrate code
-  • help               - Show available commands
-  • exit/quit          - Exit chat mode"""
+        description=_subcmd_description("CHAT_DESCRIPTION")
     )
     chat_parser.add_argument(
         "-v", "--verbose", 
         action="store_true",
         help="Enable detailed processing information in chat mode"
     )
-    
-    # Add examples for better UX
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="%(prog)s 0.1.0"
-    )
-    
+
+
+# One builder per subcommand so a single-command invocation constructs only
+# the subparser it needs; argparse subparser construction dominates CLI
+# startup once the heavy imports are deferred.
+_SUBCMD_BUILDERS = {
+    "doc": _build_doc_parser,
+    "summarize": _build_summarize_parser,
+    "test": _build_test_parser,
+    "inspect": _build_inspect_parser,
+    "refactor": _build_refactor_parser,
+    "annotate": _build_annotate_parser,
+    "migrate": _build_migrate_parser,
+    "chat": _build_chat_parser,
+}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Find the invoked subcommand in argv without a full parse.
+
+    Returns None when no known command appears or help/version output is
+    requested, in which case every subparser must exist.
+    """
+    for token in argv:
+        if token in ("-h", "--help", "--version"):
+            return None
+        if token in _SUBCMD_BUILDERS:
+            return token
+    return None
+
+
+_OUTPUT_MODES = ("console", "in-place", "new-file")
+
+
+class _Args:
+    """Slots-backed container for the fixed set of CLI arguments.
+
+    Cheaper than an argparse Namespace: attribute reads are C-level slot
+    loads instead of __dict__ probes, and every field always exists so
+    callers need no getattr fallbacks.
+    """
+
+    __slots__ = ("command", "path", "output", "secure", "verbose", "target")
+
+    def __init__(self, ns=None):
+        self.command = getattr(ns, "command", None)
+        self.path = getattr(ns, "path", None)
+        self.output = getattr(ns, "output", "console") or "console"
+        self.secure = getattr(ns, "secure", False) or False
+        self.verbose = getattr(ns, "verbose", False) or False
+        self.target = getattr(ns, "target", None)
+
+
+def _fast_parse(argv: List[str]) -> Optional[_Args]:
+    """Parse the common ``breeze <cmd> <path> [flags]`` shape without argparse.
+
+    Returns None for anything outside the simple pattern — help/version,
+    unknown flags, or migrate (which needs --target validation) — so the
+    caller falls back to the full argparse machinery.
+    """
+    if not argv:
+        return None
+    cmd = argv[0]
+    if cmd not in _SUBCMD_BUILDERS or cmd == "migrate":
+        return None
+
+    args = _Args()
+    args.command = cmd
+    # chat only defines -v/--verbose; accepting the common flags here
+    # would silently drop arguments argparse rejects with exit code 2.
+    file_flags = cmd != "chat"
+    positionals = []
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if file_flags and token == "--output":
+            value = next(tokens, None)
+            if value not in _OUTPUT_MODES:
+                return None
+            args.output = value
+        elif file_flags and token.startswith("--output="):
+            value = token[len("--output="):]
+            if value not in _OUTPUT_MODES:
+                return None
+            args.output = value
+        elif file_flags and token == "--secure":
+            args.secure = True
+        elif token in ("-v", "--verbose"):
+            args.verbose = True
+        elif token.startswith("-"):
+            return None
+        else:
+            positionals.append(token)
+
+    if cmd == "chat":
+        if positionals:
+            return None
+        return args
+    if len(positionals) != 1:
+        return None
+    args.path = positionals[0]
+    return args
+
+
+def create_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+
+    When ``only`` names a subcommand, just that subparser is built; the
+    default builds all of them (needed for --help and unknown input).
+    """
+    parser = _make_root_parser()
+    subparsers = parser.add_subparsers(dest="command", help="Available commands", metavar="COMMAND")
+    common_parser = _make_common_parser()
+
+    if only in _SUBCMD_BUILDERS:
+        _SUBCMD_BUILDERS[only](subparsers, common_parser)
+    else:
+        for build in _SUBCMD_BUILDERS.values():
+            build(subparsers, common_parser)
+
     return parser
 
 
 def print_usage_examples():
     """Print comprehensive usage examples."""
-    examples = """
-🌟 Breeze Usage Examples:
-
-📝 Documentation Generation:
-  breeze doc calculator.py                    # Python docstrings
-  breeze doc utils.js --output new-file       # JavaScript JSDoc
-  breeze doc MathUtils.java -v               # Java Javadoc with verbose output
-
-📊 Code Analysis:
-  breeze summarize large_project.py           # Get code overview
-  breeze inspect security_check.php           # Find security issues
-  breeze inspect memory_manager.cpp --verbose # C++ memory analysis
-
-🧪 Test Generation:
-  breeze test api_client.py --output new-file # Generate pytest tests
-  breeze test validator.js                    # Generate Jest tests
-  breeze test calculator.java                 # Generate JUnit tests
-
-⚡ Code Improvement:
-  breeze refactor legacy_code.py --secure     # Refactor with confirmation
-  breeze annotate api.ts --output in-place    # Add TypeScript types
-  breeze refactor old_script.js -v            # Modern JavaScript patterns
-
-🔄 Code Migration:
-  breeze migrate old_app.py --target "Python 3.12"
-  breeze migrate jquery_code.js --target "React"
-  breeze migrate legacy.java --target "Java 17"
-  breeze migrate script.py --target "TypeScript" --output new-file
-
-💬 Interactive Mode:
-  breeze chat                                 # Start interactive session
-  # In chat mode:
-  # > analyze my_project.py for performance issues
-  # > convert this Python code to JavaScript
-  # > help me refactor this function
-
-🎯 Output Modes:
-  --output console     # Display results (default)
-  --output in-place    # Modify original file  
-  --output new-file    # Create new file
-
-🛡️ Safety Options:
-  --secure            # Ask for confirmation before changes
-  --verbose           # Show detailed processing info
-
-📁 Supported File Types:
-  Programming: .py .js .ts .java .cpp .c .cs .php .rb .go .rs .swift .kt
-  Web:         .html .css .scss .sass .sql
-  Data:        .json .xml .yaml .yml
-  Config:      .sh .bat .ps1 .md .txt
-  And more!
-"""
-    print(examples)
+    from . import _help_texts
+    print(_help_texts.EXAMPLES)
 
 
 def print_chat_help() -> None:
     """Print comprehensive help for chat mode."""
-    help_text = """
-💬 Breeze Interactive Chat Mode Help:
-
-🎯 Direct Commands:
-  doc <file>                   - Generate documentation
-  summarize <file>             - Create code summary  
-  test <file>                  - Generate unit tests
-  inspect <file>               - Analyze for bugs and issues
-  refactor <file>              - Improve code structure
-  annotate <file>              - Add type annotations
-  migrate <file> --target X    - Migrate to target version/language
-
-🗣️ Natural Language Queries:
-  "Analyze security issues in auth.py"
-  "Generate tests for my calculator class"
-  "Convert this Python code to JavaScript"
-  "Refactor this function to be more readable"
-  "What are the potential bugs in this C++ code?"
-  "Add TypeScript types to my API client"
-  "Help me migrate from jQuery to React"
-
-🎛️ Chat Options:
-  help                         - Show this help message
-  examples                     - Show usage examples
-  supported                    - List supported file types
-  exit, quit, q               - Exit chat mode
-
-💡 Tips:
-  • You can reference files by path: "doc src/utils.py"  
-  • Ask questions about code: "What does this function do?"
-  • Request explanations: "Explain this algorithm"
-  • Get recommendations: "Best practices for this code?"
-  • Multiple files: "Compare these two implementations"
-
-🌟 Example Chat Session:
-  breeze> doc calculator.py
-  breeze> What security issues might this PHP code have?
-  breeze> Convert my Python script to TypeScript
-  breeze> help me optimize this SQL query
-  breeze> exit
-
-🔧 For non-interactive usage, use: breeze <command> <file> [options]
-"""
-    print(help_text)
+    from . import _help_texts
+    print(_help_texts.CHAT_HELP)
 
 
 def print_supported_languages():
     """Print all supported programming languages and file types."""
-    languages = """
-🌐 Breeze Supported Languages & File Types:
-
-💻 Programming Languages:
-  • Python         (.py)      - Docstrings, pytest, type hints
-  • JavaScript     (.js)      - JSDoc, Jest, modern ES features  
-  • TypeScript     (.ts)      - TSDoc, type annotations, interfaces
-  • Java           (.java)    - Javadoc, JUnit, generics
-  • C++            (.cpp/.cc) - Doxygen, Google Test, modern C++
-  • C              (.c)       - Doxygen, Unity Test, ANSI/C99/C11
-  • C#             (.cs)      - XML docs, NUnit, nullable references  
-  • PHP            (.php)     - PHPDoc, PHPUnit, type declarations
-  • Ruby           (.rb)      - YARD, RSpec, idiomatic patterns
-  • Go             (.go)      - Go docs, testing package, interfaces
-  • Rust           (.rs)      - Rust docs, built-in tests, ownership
-  • Swift          (.swift)   - Swift docs, XCTest
-  • Kotlin         (.kt)      - KDoc, JUnit integration
-  • Scala          (.scala)   - ScalaDoc, ScalaTest
-
-🌐 Web Technologies:
-  • HTML           (.html)    - Semantic markup, accessibility
-  • CSS            (.css)     - Modern CSS, responsive design
-  • SCSS/Sass      (.scss)    - Sass features, optimization  
-  • SQL            (.sql)     - Query optimization, security
-
-📄 Data & Configuration:
-  • JSON           (.json)    - Structure validation, schema
-  • XML            (.xml)     - Well-formed validation, XSD
-  • YAML           (.yaml)    - Configuration analysis
-  • TOML           (.toml)    - Configuration files
-  • Markdown       (.md)      - Documentation, formatting
-
-🔧 Scripts & Tools:
-  • Shell Scripts  (.sh)      - Bash/Zsh, best practices
-  • Batch Files    (.bat)     - Windows batch scripting
-  • PowerShell     (.ps1)     - PowerShell scripting
-  • Makefile       (Makefile) - Build system optimization
-
-📝 Text Files:
-  • Plain Text     (.txt)     - General text analysis
-  • Config Files   (.conf)    - Configuration analysis
-  • Log Files      (.log)     - Log pattern analysis
-
-🔄 Language-Specific Features:
-
-Python:           PEP compliance, type hints, context managers
-JavaScript:       ES6+, async/await, modern patterns  
-TypeScript:       Strict typing, interfaces, generics
-Java:             OOP patterns, streams, lambda expressions
-C++:              RAII, smart pointers, templates
-Rust:             Ownership, lifetimes, trait bounds
-Go:               Idiomatic patterns, goroutines, interfaces
-
-🚀 Coming Soon:
-  • Dart, Flutter  • R, Julia     • Haskell, F#
-  • Assembly       • Dockerfile   • Terraform
-  • More frameworks and DSLs!
-"""
-    print(languages)
+    from . import _help_texts
+    print(_help_texts.SUPPORTED)
+
+
+# Extensions Breeze knows how to handle. Checked before the orchestrator
+# (and the Gemini stack behind it) is ever constructed so an unsupported
+# file fails fast without paying the heavy imports.
+_SUPPORTED_EXTS = frozenset({
+    ".py", ".js", ".ts", ".java", ".cpp", ".cc", ".c", ".cs", ".php",
+    ".rb", ".go", ".rs", ".swift", ".kt", ".scala",
+    ".html", ".css", ".scss", ".sass", ".sql",
+    ".json", ".xml", ".yaml", ".yml", ".toml",
+    ".md", ".sh", ".bat", ".ps1", ".txt", ".conf", ".log",
+})
+
+
+# Error-suggestion hints, keyed by a lowercase needle found in the error
+# message. Built once so the error path lowercases str(e) a single time
+# and scans this tuple instead of re-allocating per substring test.
+_API_HINTS = "\n".join([
+    "   • Check your GEMINI_API_KEY environment variable",
+    "   • Verify your internet connection",
+    "   • Ensure your API key is valid and active",
+])
+_ENCODING_HINTS = "\n".join([
+    "   • File might use different encoding",
+    "   • Try converting file to UTF-8",
+])
+_TIMEOUT_HINTS = "\n".join([
+    "   • File might be too large or complex",
+    "   • Try with a smaller file",
+])
+_MEMORY_HINTS = "\n".join([
+    "   • File is too large for available memory",
+    "   • Try processing a smaller file",
+])
+_DEFAULT_HINTS = "\n".join([
+    "   • Check file path and permissions",
+    "   • Verify file format is supported",
+    "   • Try with --verbose for more details",
+])
+_ERROR_HINTS = (
+    ("api", _API_HINTS),
+    ("gemini", _API_HINTS),
+    ("encoding", _ENCODING_HINTS),
+    ("decode", _ENCODING_HINTS),
+    ("timeout", _TIMEOUT_HINTS),
+    ("memory", _MEMORY_HINTS),
+)
+
+
+# Chat-loop dispatch tables: one lowercase pass and one set/dict lookup per
+# turn instead of an elif chain of repeated .lower() comparisons.
+_EXIT_TOKENS = frozenset({"exit", "quit", "q"})
+_CMD_HANDLERS = {
+    "help": print_chat_help,
+    "examples": print_usage_examples,
+    "supported": print_supported_languages,
+}
+
+
+def _find_similar(parent_dir, stem_lower: str, limit: int = 5):
+    """Yield up to ``limit`` sibling files whose stem contains ``stem_lower``.
+
+    Generator over os.scandir so a huge directory costs at most ``limit``
+    hits plus the scan up to them, never a full listing in memory.
+    """
+    found = 0
+    try:
+        with os.scandir(parent_dir) as entries:
+            for entry in entries:
+                if found >= limit:
+                    return
+                if entry.is_file(follow_symlinks=False) and stem_lower in entry.name.lower():
+                    found += 1
+                    yield entry.path
+    except OSError:
+        return
+
+
+def _require_api_key() -> str:
+    """Exit with setup instructions when GEMINI_API_KEY is not configured.
+
+    Called only on paths that are about to talk to the API, so purely
+    informational invocations never touch the environment.
+    """
+    from .utils import get_api_key
+    api_key = get_api_key()
+    if not api_key:
+        # One write instead of seven prints: the block lands in a single
+        # syscall and cannot interleave with other output.
+        sys.stdout.write("\n".join([
+            "❌ Error: GEMINI_API_KEY environment variable not set.",
+            "",
+            "🔑 Please set your Google AI API key:",
+            "  Windows (CMD):      set GEMINI_API_KEY \"your_key_here\"",
+            "  Windows (PowerShell): $env:GEMINI_API_KEY=\"your_key_here\"",
+            "  Linux/macOS:        export GEMINI_API_KEY=your_key_here",
+            "",
+            "🌐 Get your API key at: https://ai.google.dev/",
+            "📖 For detailed setup instructions, run: breeze --help",
+        ]) + "\n")
+        sys.exit(1)
+    
+    # Validate API key format (basic check)
+    if not api_key.startswith("AIza"):
+        print("⚠️  Warning: API key format may be incorrect (should start with 'AIza')")
+    return api_key
+
+
+_CHAT_COMPLETIONS = (
+    "doc", "summarize", "test", "inspect", "refactor", "annotate",
+    "migrate", "help", "examples", "supported", "exit", "quit",
+)
+
+
+def _setup_readline() -> None:
+    """Enable line editing, history, and tab completion for chat mode."""
+    try:
+        import readline
+    except ImportError:  # not available on some platforms
+        return
+    
+    def complete(text: str, state: int):
+        matches = [c for c in _CHAT_COMPLETIONS if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
 
 
 def handle_chat_mode(verbose: bool = False) -> None:
     """Enhanced chat mode handler with better UX."""
-    print("🌬️  Welcome to Breeze Interactive Mode!")
-    print("AI-powered multi-language code assistant\n")
-    
+    _setup_readline()
+    from . import _help_texts
+    sys.stdout.write(_help_texts.CHAT_WELCOME)
     if verbose:
-        print("🔧 Verbose mode enabled - detailed processing info will be shown")
-    
-    print("💡 Quick start:")
-    print("  • Type 'help' for available commands")
-    print("  • Type 'examples' for usage examples") 
-    print("  • Type 'supported' for supported languages")
-    print("  • Type 'exit' or 'quit' to end session")
-    print("  • Ask questions like: 'analyze bugs in my_file.py'")
-    print("")
+        sys.stdout.write("🔧 Verbose mode enabled - detailed processing info will be shown\n")
+    sys.stdout.write(_help_texts.CHAT_QUICK_START)
     
+    _require_api_key()
+    from .flow import FlowOrchestrator
     orchestrator = FlowOrchestrator()
     session_count = 0
     
@@ -440,19 +480,15 @@ def handle_chat_mode(verbose: bool = False) -> None:
             prompt = f"breeze[{session_count}]> " if session_count > 0 else "breeze> "
             user_input = input(prompt).strip()
             
-            if user_input.lower() in ["exit", "quit", "q"]:
+            low = user_input.lower()
+            if low in _EXIT_TOKENS:
                 print("👋 Thanks for using Breeze! Goodbye!")
                 break
-            elif user_input.lower() == "help":
-                print_chat_help()
+            handler = _CMD_HANDLERS.get(low)
+            if handler:
+                handler()
                 continue
-            elif user_input.lower() == "examples":
-                print_usage_examples()
-                continue
-            elif user_input.lower() == "supported":
-                print_supported_languages()
-                continue
-            elif not user_input:
+            if not user_input:
                 continue
             
             session_count += 1
@@ -462,7 +498,7 @@ def handle_chat_mode(verbose: bool = False) -> None:
             result = orchestrator.process_chat_input(user_input, verbose=verbose)
             print(f"\n📋 Result:\n{result}\n")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Thanks for using Breeze! Goodbye!")
             break
         except Exception as e:
@@ -474,109 +510,62 @@ def handle_chat_mode(verbose: bool = False) -> None:
             print("💡 Try 'help' for assistance or 'exit' to quit\n")
 
 
-def handle_chat_mode(verbose: bool = False) -> None:
-    """Handle interactive chat mode."""
-    if verbose:
-        print("Starting Breeze interactive chat session...")
-        print("Type 'exit' or 'quit' to end the session.")
-        print("Type 'help' for available commands.\n")
-    
-    orchestrator = FlowOrchestrator()
-    
-    while True:
-        try:
-            user_input = input("breeze> ").strip()
-            
-            if user_input.lower() in ["exit", "quit"]:
-                print("Goodbye!")
-                break
-            elif user_input.lower() == "help":
-                print_chat_help()
-                continue
-            elif not user_input:
-                continue
-            
-            # Process the chat input through the orchestrator
-            result = orchestrator.process_chat_input(user_input, verbose=verbose)
-            print(result)
-            
-        except KeyboardInterrupt:
-            print("\nGoodbye!")
-            break
-        except Exception as e:
-            print(f"Error: {e}")
-
-
-def print_chat_help() -> None:
-    """Print help for chat mode."""
-    help_text = """
-Available commands in chat mode:
-- doc <file>: Generate docstrings
-- summarize <file>: Summarize code
-- test <file>: Generate tests
-- inspect <file>: Detect bugs
-- refactor <file>: Suggest refactorings
-- annotate <file>: Add type annotations
-- migrate <file> --target <spec>: Migrate code
-- help: Show this help
-- exit/quit: Exit chat mode
-
-You can also ask natural language questions about code analysis tasks.
-"""
-    print(help_text)
-
-
 def main() -> None:
     """Enhanced main entry point for the Breeze CLI."""
-    parser = create_parser()
+    argv = sys.argv[1:]
     
-    # Handle no arguments - show help with examples
-    if len(sys.argv) == 1:
-        parser.print_help()
-        print("\n" + "="*60)
-        print_usage_examples()
-        return
+    # Fast path: the plain <cmd> <path> [flags] shape skips argparse entirely
+    args = _fast_parse(argv)
+    if args is None:
+        parser = create_parser(only=_sniff_subcommand(argv))
+        
+        # Handle no arguments - show help with examples
+        if not argv:
+            parser.print_help()
+            print("\n" + "="*60)
+            print_usage_examples()
+            return
+        
+        args = _Args(parser.parse_args())
     
-    args = parser.parse_args()
+    # Bind the frequently consulted arguments once; everything below reads
+    # these locals instead of repeating attribute lookups on the container.
+    cmd = args.command
+    verbose = args.verbose
+    path = args.path
+    output = args.output
+    secure = args.secure
+    target = args.target
     
     # Setup logging
-    setup_logging(verbose=getattr(args, "verbose", False))
-    
-    # Check for API key
-    api_key = get_api_key()
-    if not api_key:
-        print("❌ Error: GEMINI_API_KEY environment variable not set.")
-        print("\n🔑 Please set your Google AI API key:")
-        print("  Windows (CMD):      set GEMINI_API_KEY \"your_key_here\"")
-        print("  Windows (PowerShell): $env:GEMINI_API_KEY=\"your_key_here\"")
-        print("  Linux/macOS:        export GEMINI_API_KEY=your_key_here")
-        print("\n🌐 Get your API key at: https://ai.google.dev/")
-        print("📖 For detailed setup instructions, run: breeze --help")
-        sys.exit(1)
-    
-    # Validate API key format (basic check)
-    if not api_key.startswith("AIza"):
-        print("⚠️  Warning: API key format may be incorrect (should start with 'AIza')")
+    from .utils import setup_logging, get_file_type
+    setup_logging(verbose=verbose)
     
     # Handle chat mode
-    if args.command == "chat":
+    if cmd == "chat":
         try:
-            handle_chat_mode(verbose=getattr(args, "verbose", False))
+            handle_chat_mode(verbose=verbose)
         except KeyboardInterrupt:
             print("\n👋 Chat session interrupted. Goodbye!")
         except Exception as e:
             print(f"❌ Chat mode error: {e}")
-            if getattr(args, "verbose", False):
+            if verbose:
                 import traceback
                 traceback.print_exc()
         return
     
-    # Validate file path for non-chat commands
-    if hasattr(args, "path"):
-        path = args.path
+    # Validate file path for non-chat commands. One os.stat call answers
+    # exists/is-file/is-dir/size instead of a syscall per Path method.
+    if path is not None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Missing file, but also PermissionError, ELOOP, an
+            # over-long name, ... — anything the old Path.exists()
+            # swallowed gets the friendly message, not a traceback.
+            st = None
         
-        # Check if file exists
-        if not Path(path).exists():
+        if st is None:
             print(f"❌ Error: File '{path}' does not exist.")
             
             # Provide helpful suggestions
@@ -584,19 +573,13 @@ def main() -> None:
             parent_dir = path_obj.parent
             
             if parent_dir.exists():
-                # Look for similar files in the directory
-                similar_files = []
-                try:
-                    for file in parent_dir.iterdir():
-                        if file.is_file() and path_obj.stem.lower() in file.stem.lower():
-                            similar_files.append(str(file))
-                except:
-                    pass
-                
-                if similar_files:
-                    print("💡 Did you mean one of these files?")
-                    for similar_file in similar_files[:5]:  # Show max 5 suggestions
-                        print(f"   {similar_file}")
+                # Look for similar files in the directory (max 5 suggestions)
+                first = True
+                for similar_file in _find_similar(parent_dir, path_obj.stem.lower()):
+                    if first:
+                        print("💡 Did you mean one of these files?")
+                        first = False
+                    print(f"   {similar_file}")
             else:
                 print(f"💡 Directory '{parent_dir}' does not exist either.")
             
@@ -604,32 +587,46 @@ def main() -> None:
             sys.exit(1)
         
         # Check if it's a file (not a directory)
-        if not Path(path).is_file():
+        if not stat.S_ISREG(st.st_mode):
             print(f"❌ Error: '{path}' is not a file.")
-            if Path(path).is_dir():
+            if stat.S_ISDIR(st.st_mode):
                 print("💡 This appears to be a directory. Please specify a file path.")
                 # Show some files in the directory
                 try:
-                    files = [f for f in Path(path).iterdir() if f.is_file()]
-                    if files:
-                        print("📁 Files in this directory:")
-                        for file in files[:10]:  # Show max 10 files
-                            print(f"   {file.name}")
-                        if len(files) > 10:
-                            print(f"   ... and {len(files) - 10} more files")
-                except:
+                    shown = 0
+                    extra = 0
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            if shown < 10:  # Show max 10 files
+                                if shown == 0:
+                                    print("📁 Files in this directory:")
+                                print(f"   {entry.name}")
+                                shown += 1
+                            else:
+                                extra += 1
+                    if extra:
+                        print(f"   ... and {extra} more files")
+                except OSError:
                     pass
             sys.exit(1)
         
+        # Reject unsupported extensions before any heavy machinery spins up
+        if Path(path).suffix.lower() not in _SUPPORTED_EXTS:
+            print(f"❌ Error: '{path}' has an unsupported file type.")
+            print(f"\n📁 Supported file types: .py .js .ts .java .cpp .c .cs .php .rb .go .rs .html .css .sql .json .xml .yaml .md .txt and more")
+            sys.exit(1)
+        
         # Get file type and show it if verbose
         file_type = get_file_type(path)
-        if getattr(args, "verbose", False):
+        if verbose:
             print(f"📄 Detected file type: {file_type}")
-            print(f"📏 File size: {Path(path).stat().st_size} bytes")
+            print(f"📏 File size: {st.st_size} bytes")
     
     # Validate command-specific requirements
-    if hasattr(args, "target") and args.command == "migrate":
-        if not args.target:
+    if cmd == "migrate":
+        if not target:
             print("❌ Error: Migration target is required for migrate command.")
             print("💡 Examples:")
             print("   --target \"Python 3.12\"")
@@ -639,47 +636,49 @@ def main() -> None:
             sys.exit(1)
     
     # Show operation info if verbose
-    if getattr(args, "verbose", False):
-        print(f"🚀 Starting {args.command} operation...")
-        print(f"📂 File: {getattr(args, 'path', 'N/A')}")
-        print(f"📤 Output mode: {getattr(args, 'output', 'console')}")
-        if hasattr(args, "target"):
-            print(f"🎯 Target: {getattr(args, 'target', 'N/A')}")
-        if getattr(args, "secure", False):
+    if verbose:
+        print(f"🚀 Starting {cmd} operation...")
+        print(f"📂 File: {path if path is not None else 'N/A'}")
+        print(f"📤 Output mode: {output}")
+        if target is not None:
+            print(f"🎯 Target: {target}")
+        if secure:
             print("🛡️  Secure mode: User approval required for changes")
         print("-" * 50)
     
     # Create flow orchestrator and process command
+    _require_api_key()
+    from .flow import FlowOrchestrator
     orchestrator = FlowOrchestrator()
     
     try:
         # Process the command
         result = orchestrator.process_command(
-            command=args.command,
-            path=getattr(args, "path", None),
-            output_mode=getattr(args, "output", "console"),
-            secure=getattr(args, "secure", False),
-            verbose=getattr(args, "verbose", False),
-            target=getattr(args, "target", None)
+            command=cmd,
+            path=path,
+            output_mode=output,
+            secure=secure,
+            verbose=verbose,
+            target=target
         )
         
         # Handle output
         if result:
             # Add separator for better readability in verbose mode
-            if getattr(args, "verbose", False):
+            if verbose:
                 print("-" * 50)
                 print("📋 Result:")
             
             print(result)
             
             # Show success message for file operations
-            if getattr(args, "output", "console") != "console":
-                print(f"\n✅ {args.command.title()} operation completed successfully")
+            if output != "console":
+                print(f"\n✅ {cmd.title()} operation completed successfully")
         else:
             print("✅ Operation completed successfully (no output generated)")
     
     except KeyboardInterrupt:
-        print(f"\n⏹️  {args.command.title()} operation interrupted by user")
+        print(f"\n⏹️  {cmd.title()} operation interrupted by user")
         sys.exit(1)
     
     except FileNotFoundError as e:
@@ -700,10 +699,10 @@ def main() -> None:
     
     except Exception as e:
         error_type = type(e).__name__
-        print(f"❌ {error_type} during {args.command} operation:")
+        print(f"❌ {error_type} during {cmd} operation:")
         
         # Show different levels of error detail based on verbose mode
-        if getattr(args, "verbose", False):
+        if verbose:
             print(f"   Full error: {str(e)}")
             print("\n📋 Full traceback:")
             import traceback
@@ -714,29 +713,19 @@ def main() -> None:
             print("🔧 Common solutions:")
             
             # Provide error-specific suggestions
-            if "API" in str(e) or "gemini" in str(e).lower():
-                print("   • Check your GEMINI_API_KEY environment variable")
-                print("   • Verify your internet connection")
-                print("   • Ensure your API key is valid and active")
-            elif "encoding" in str(e).lower() or "decode" in str(e).lower():
-                print("   • File might use different encoding")
-                print("   • Try converting file to UTF-8")
-            elif "timeout" in str(e).lower():
-                print("   • File might be too large or complex")
-                print("   • Try with a smaller file")
-            elif "memory" in str(e).lower():
-                print("   • File is too large for available memory")
-                print("   • Try processing a smaller file")
+            low = str(e).lower()
+            for needle, hints in _ERROR_HINTS:
+                if needle in low:
+                    print(hints)
+                    break
             else:
-                print("   • Check file path and permissions")
-                print("   • Verify file format is supported")
-                print("   • Try with --verbose for more details")
+                print(_DEFAULT_HINTS)
         
         sys.exit(1)
     
     # Final verbose output
-    if getattr(args, "verbose", False):
-        print(f"\n🏁 {args.command.title()} operation finished")
+    if verbose:
+        print(f"\n🏁 {cmd.title()} operation finished")
 
 
 # Additional helper function for the main module
@@ -767,8 +756,3 @@ if __name__ == "__main__":
         print(f"\n💥 Unexpected error: {e}")
         print("🔧 Please report this issue if it persists")
         sys.exit(1)
-
-
-
-if __name__ == "__main__":
-    main()
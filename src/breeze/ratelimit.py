@@ -0,0 +1,84 @@
+"""Proactive token-bucket rate limiting for Gemini calls."""
+
+import os
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Meters requests-per-minute and tokens-per-minute before each call.
+
+    Both buckets refill continuously from a monotonic clock; consume()
+    blocks briefly until capacity is available instead of letting a
+    burst hit the API quota and cascade into 429 retries. Thread-safe,
+    so concurrent batch workers can share one bucket. A limit of None
+    disables that dimension; with both unset the bucket is a no-op.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._requests = rpm or 0.0
+        self._tokens = tpm or 0.0
+        self._last = time.monotonic()
+
+    def _refill(self) -> None:
+        """Credit capacity accrued since the last call (lock held)."""
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+
+    def time_to_available(self, requests: float = 1, tokens: float = 0) -> float:
+        """Seconds until the requested capacity will have refilled."""
+        wait = 0.0
+        if self.rpm and self._requests < requests:
+            wait = max(wait, (requests - self._requests) * 60.0 / self.rpm)
+        if self.tpm and tokens and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60.0 / self.tpm)
+        return wait
+
+    def consume(self, requests: int = 1, tokens: int = 0) -> None:
+        """Block until capacity is available, then debit it."""
+        if not (self.rpm or self.tpm):
+            return
+        while True:
+            with self._lock:
+                self._refill()
+                wait = self.time_to_available(requests, tokens)
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= requests
+                    if self.tpm:
+                        self._tokens -= tokens
+                    return
+            time.sleep(min(wait, 1.0))
+
+
+_BUCKET: Optional[TokenBucket] = None
+_BUCKET_LOCK = threading.Lock()
+
+
+def _env_limit(name: str) -> Optional[float]:
+    raw = os.environ.get(name)
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def get_bucket() -> TokenBucket:
+    """Shared bucket configured from BREEZE_RPM / BREEZE_TPM (unset = off)."""
+    global _BUCKET
+    if _BUCKET is None:
+        with _BUCKET_LOCK:
+            if _BUCKET is None:
+                _BUCKET = TokenBucket(_env_limit("BREEZE_RPM"), _env_limit("BREEZE_TPM"))
+    return _BUCKET
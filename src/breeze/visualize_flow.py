@@ -3,10 +3,11 @@
 from typing import Dict, List, Any, Optional
 
 
-def generate_mermaid_diagram(flow_data: Dict[str, Any]) -> str:
-    """Generate a Mermaid flowchart diagram from flow data."""
-    
-    diagram = """flowchart TD
+# The diagram is static, so it is assembled once at import; calls are
+# then a pointer return instead of a fresh multi-kilobyte allocation.
+# The twelve identical agent-node style lines are generated rather than
+# spelled out, keeping the literal (and the .pyc constant pool) small.
+_DIAGRAM_HEAD = """flowchart TD
     %% User Interaction
     subgraph User["User"]
         U1["CLI / Chat Input"]
@@ -119,22 +120,29 @@ def generate_mermaid_diagram(flow_data: Dict[str, Any]) -> str:
     style M2 fill:#36d1c4,stroke:#11998e,stroke-width:2px
     style F1 fill:#43e97b,stroke:#38f9d7,stroke-width:2px
     style F2 fill:#43e97b,stroke:#38f9d7,stroke-width:2px
-    style N1 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N2 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N3 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N4 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N5 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N6 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N7 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N8 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N9 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N10 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N11 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style N12 fill:#f857a6,stroke:#ff5858,stroke-width:2px
-    style UTL1 fill:#36d1c4,stroke:#11998e,stroke-width:2px
+"""
+
+_NODE_STYLE = "    style N{} fill:#f857a6,stroke:#ff5858,stroke-width:2px\n"
+
+_DIAGRAM_TAIL = """    style UTL1 fill:#36d1c4,stroke:#11998e,stroke-width:2px
     style UTL2 fill:#36d1c4,stroke:#11998e,stroke-width:2px
     style UTL3 fill:#36d1c4,stroke:#11998e,stroke-width:2px
     style C1 fill:#f9d423,stroke:#e65c00,stroke-width:2px
 """
-    
-    return diagram
+
+_DIAGRAM = _DIAGRAM_HEAD + "".join(_NODE_STYLE.format(i) for i in range(1, 13)) + _DIAGRAM_TAIL
+
+
+# Encoded once alongside the str form, so writers can emit the diagram
+# in binary mode without re-encoding it per write.
+_DIAGRAM_BYTES = _DIAGRAM.encode('utf-8')
+
+
+def generate_mermaid_diagram(flow_data: Dict[str, Any]) -> str:
+    """Generate a Mermaid flowchart diagram from flow data."""
+    return _DIAGRAM
+
+
+def generate_mermaid_bytes(flow_data: Optional[Dict[str, Any]] = None) -> bytes:
+    """UTF-8 encoded variant for callers writing the diagram to a file."""
+    return _DIAGRAM_BYTES